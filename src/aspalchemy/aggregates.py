@@ -158,20 +158,10 @@ class Aggregate(FreezableBuilder, AggregateBase, ABC):
         )
 
     def collect_defined_constants(self) -> set[str]:
-        constants: set[str] = set()
-
-        for element in self._elements:
-            constants.update(element.collect_defined_constants())
-
-        return constants
+        return set().union(*(element.collect_defined_constants() for element in self._elements))
 
     def collect_variables(self) -> set[str]:
-        variables: set[str] = set()
-
-        for element in self._elements:
-            variables.update(element.collect_variables())
-
-        return variables
+        return set().union(*(element.collect_variables() for element in self._elements))
 
     def collect_predicate_occurrences(self, *, as_argument: bool) -> set[PredicateOccurrence]:
         # Tuple terms sit in argument positions (data); conditions hold real
@@ -6,6 +6,8 @@ Comparison), so they are merged into one module to avoid deferred imports.
 Everything else in the package imports downward from here.
 """
 
+import re
+import sys
 import threading
 import weakref
 from abc import ABC, ABCMeta, abstractmethod
@@ -41,6 +43,10 @@ type PredicateOccurrence = tuple[type[Predicate], bool, bool]
 type ExpressionFieldType = Value | Expression | int
 type ValueExpressionType = Value | Expression
 
+# Matches a name made only of ASCII letters, digits, and underscores — the
+# one definition shared by every name check in the package.
+NAME_CHARACTERS = re.compile(r"[A-Za-z0-9_]*")
+
 
 def require_int32(value: int, noun: str, extra: str = "") -> None:
     """
@@ -86,8 +92,16 @@ class Term(ABC):
     Abstract base class representing a term in an Answer Set Programming (ASP) program.
 
     This serves as the root class for all ASP term types in the hierarchy.
+
+    The abstract bases declare empty __slots__, so a concrete term that
+    declares its own is fully slotted: the values and the composite nodes a
+    large program builds by the million (Expression, Comparison,
+    DefaultNegation) carry no instance __dict__. A subclass without
+    __slots__ simply keeps one.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self, context: RenderingContext = RenderingContext.DEFAULT) -> str:
         """
@@ -151,15 +165,13 @@ class Term(ABC):
         """All Predicate classes used in this term."""
         return {predicate for predicate, _negated, _is_atom in self.collect_predicate_occurrences(as_argument=False)}
 
-    @abstractmethod
     def collect_defined_constants(self) -> set[str]:
-        """Collects all defined constant names used in this term."""
-        pass
+        """Collects all defined constant names used in this term; empty by default (a leaf names none)."""
+        return set()
 
-    @abstractmethod
     def collect_variables(self) -> set[str]:
-        """Collects the names of all variables used in this term."""
-        pass
+        """Collects the names of all variables used in this term; empty by default (a leaf binds none)."""
+        return set()
 
     def freeze(self) -> None:  # noqa: B027 (deliberate no-op default, not a forgotten abstract)
         """
@@ -178,6 +190,8 @@ class BasicTerm(Term, ABC):
     BasicTerms are the fundamental building blocks for constructing ASP programs.
     """
 
+    __slots__ = ()
+
 
 class PredicateBase(BasicTerm, ABC):
     """
@@ -187,6 +201,8 @@ class PredicateBase(BasicTerm, ABC):
     the Predicate class itself.
     """
 
+    __slots__ = ()
+
 
 class ComparableTerm(Term, ABC):
     """
@@ -206,6 +222,8 @@ class ComparableTerm(Term, ABC):
     # until the first miss. Use sets for containment.
     __hash__ = object.__hash__
 
+    __slots__ = ()
+
     def _comparison(self, operator: ComparisonOperator, other: Any) -> Comparison:
         """The shared operand guard: one home for the teaching on each rejected shape."""
         if isinstance(other, Pool):
@@ -260,6 +278,8 @@ class Negatable(Term, ABC):
     error: bitwise complement is spelled Compl(x).)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __invert__(self) -> DefaultNegation | Comparison:
         """~term: "not term" for atoms and negations; the COMPLEMENT for plain comparisons (see Not)."""
@@ -274,6 +294,8 @@ class ArithmeticOps:
     Expression, exactly the types Expression's operands accept.
     """
 
+    __slots__ = ()
+
     def __add__(self: Any, other: ExpressionFieldType) -> Expression:
         return Expression(self, Operation.ADD, other)
 
@@ -428,8 +450,15 @@ class Value(BasicTerm, ComparableTerm, ArithmeticOps, ABC, metaclass=_ValueMeta)
     Pickling, and Identity" in src/aspalchemy/CLAUDE.md for the whole story.)
     """
 
+    # Slotted like the composite terms; __weakref__ is what lets the
+    # interning cache hold its entries weakly
+    __slots__ = ("__weakref__",)
+
     _cache: ClassVar[weakref.WeakValueDictionary[tuple[type, Any], Value]] = weakref.WeakValueDictionary()
     _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    # The slot holding the one constructor argument, for __reduce__; None
+    # for the argument-free singletons
+    _argument_slot: ClassVar[str | None] = None
 
     @classmethod
     def clear_cache(cls) -> None:
@@ -460,13 +489,15 @@ class Value(BasicTerm, ComparableTerm, ArithmeticOps, ABC, metaclass=_ValueMeta)
         Pickle as "call the class with the stored value": unpickling routes
         through the interning metaclass, so the loaded object IS the
         canonical resident and the identity guarantees survive the round
-        trip. Concrete Values hold exactly their constructor argument
-        (Supremum/Infimum hold nothing, and their __new__ returns the
-        singleton), so the instance dict is the argument list. copy and
-        deepcopy never reach this hook — __copy__/__deepcopy__ above return
-        self directly.
+        trip. Each concrete Value names the slot holding its constructor
+        argument in _argument_slot; anything else it stores is derived
+        from that (Number and String stash their rendered text), and
+        Supremum/Infimum store nothing — their __new__ returns the
+        singleton. copy and deepcopy never reach this hook —
+        __copy__/__deepcopy__ above return self directly.
         """
-        return (type(self), tuple(self.__dict__.values()))
+        slot = type(self)._argument_slot
+        return (type(self), () if slot is None else (getattr(self, slot),))
 
     @abstractmethod
     def render(
@@ -498,16 +529,28 @@ class Variable(Value):
     pool: X.in_((Cell(1, 2), Cell(3, 4))).
     """
 
+    __slots__ = ("_is_anonymous", "_name")
+    _argument_slot: ClassVar[str | None] = "_name"
+
     def __init__(self, name: str, /):
         if not isinstance(name, str):
             raise TypeError(f"Variable name must be a string, got {type(name).__name__}")
+        # Interned: names become set and dict keys in every variable walk and
+        # scoping check, and names built at runtime (V.Cell, f-strings)
+        # otherwise arrive as distinct string objects. str() first: intern
+        # refuses str subclasses (a StrEnum member, say), and the checks below
+        # then see exactly the string that is stored
+        name = sys.intern(str(name))
         if not name.isascii():
             raise ValueError(f"Variable name must be ASCII (gringo's lexer is ASCII-only): {name!r}")
         if not name or (name != "_" and not name[0].isupper()):
             raise ValueError(f"Variable name must start with an uppercase letter or be '_': {name}")
-        if not all(c.isalnum() or c == "_" for c in name):
+        if not NAME_CHARACTERS.fullmatch(name):
             raise ValueError(f"Variable name can only contain letters, digits, and underscores: {name}")
         self._name = name
+        # Derived from the name, like Number's rendered text: the scoping
+        # checks ask per variable occurrence
+        self._is_anonymous = name == "_"
 
     @property
     def name(self) -> str:
@@ -516,7 +559,7 @@ class Variable(Value):
     @property
     def is_anonymous(self) -> bool:
         """True if this is the anonymous variable '_'."""
-        return self._name == "_"
+        return self._is_anonymous
 
     def render(
         self,
@@ -535,9 +578,6 @@ class Variable(Value):
         """Variables can only appear as arguments, never standalone: always raises."""
         raise ValueError("Variables can only be used as arguments to predicates or other terms")
 
-    def collect_defined_constants(self) -> set[str]:
-        return set()
-
     def __repr__(self) -> str:
         return f"Variable({self._name!r})"
 
@@ -607,6 +647,9 @@ class ConstantBase(Value, ABC):
     for both regular constants and defined constants.
     """
 
+    __slots__ = ()
+    _argument_slot: ClassVar[str | None] = "_value"
+
     @property
     def is_grounded(self) -> bool:
         """Constants are always grounded."""
@@ -616,13 +659,6 @@ class ConstantBase(Value, ABC):
         """Constants can only appear as arguments, never standalone: always raises."""
         raise ValueError("Constants can only be used as arguments to predicates or other terms")
 
-    def collect_defined_constants(self) -> set[str]:
-        """Empty by default; DefinedConstant overrides to report its name."""
-        return set()
-
-    def collect_variables(self) -> set[str]:
-        return set()
-
 
 class Number(ConstantBase):
     """
@@ -632,6 +668,8 @@ class Number(ConstantBase):
     or as arguments to predicates.
     """
 
+    __slots__ = ("_rendered", "_value")
+
     def __init__(self, value: int, /):
         # bool subclasses int, and a boolean is never a valid ASP term
         if isinstance(value, bool) or not isinstance(value, int):
@@ -640,6 +678,8 @@ class Number(ConstantBase):
         # instances before construction (what is keyed is what is stored)
         require_int32(value, "Number value")
         self._value = value
+        # Interned and immutable: the text is formatted once, not per render
+        self._rendered = str(value)
 
     @property
     def value(self) -> int:
@@ -651,13 +691,13 @@ class Number(ConstantBase):
         parent_op: Operation | None = None,
         is_right_operand: bool = False,
     ) -> str:
-        return str(self.value)
+        return self._rendered
 
     def __repr__(self) -> str:
         return f"Number({self._value!r})"
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._rendered
 
 
 class String(ConstantBase):
@@ -667,6 +707,8 @@ class String(ConstantBase):
     String constants are enclosed in quotes in ASP syntax.
     """
 
+    __slots__ = ("_rendered", "_value")
+
     def __init__(self, value: str, /):
         """No double quotes, backslashes, or newlines (no escaping support); single quotes are fine."""
         if not isinstance(value, str):
@@ -675,6 +717,8 @@ class String(ConstantBase):
         # instances before construction (what is keyed is what is stored)
         require_clean_string(value, "String constant")
         self._value = value
+        # Interned and immutable: the quoting is done once, not per render
+        self._rendered = f'"{value}"'
 
     @property
     def value(self) -> str:
@@ -686,14 +730,14 @@ class String(ConstantBase):
         parent_op: Operation | None = None,
         is_right_operand: bool = False,
     ) -> str:
-        return f'"{self.value}"'
+        return self._rendered
 
     def __repr__(self) -> str:
         return f"String({self._value!r})"
 
     def __str__(self) -> str:
         """The rendered ASP text, quotes included: "e" is a string, e is a symbol."""
-        return f'"{self.value}"'
+        return self._rendered
 
 
 class DefinedConstant(ConstantBase):
@@ -705,10 +749,15 @@ class DefinedConstant(ConstantBase):
     at grounding.
     """
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: str, /):
         """value is the constant's name: lowercase first letter, then letters, digits, and underscores."""
         if not isinstance(value, str):
             raise TypeError(f"Defined constant name must be a string, got {type(value).__name__}")
+        # Interned like Variable names: collected into sets and matched
+        # against the program's #const table
+        value = sys.intern(str(value))
         if not value.isascii():
             raise ValueError(f"Defined constant name must be ASCII (gringo's lexer is ASCII-only): {value!r}")
         if not value or not value[0].islower():
@@ -716,7 +765,7 @@ class DefinedConstant(ConstantBase):
         if value == "not":
             raise ValueError("'not' is reserved in ASP and cannot be a constant name")
 
-        if not all(c.isalnum() or c == "_" for c in value):
+        if not NAME_CHARACTERS.fullmatch(value):
             raise ValueError(f"Defined constant can only contain letters, digits, and underscores: {value}")
 
         self._value = value
@@ -758,6 +807,9 @@ class ExtremeConstant(ConstantBase, ABC):
     Strings, #sup/#inf in an expression is undefined for every program.
     """
 
+    __slots__ = ()
+    _argument_slot = None
+
     _TEXT: ClassVar[str]
     # One instance per concrete class, held strongly: unlike the weak value
     # cache, a singleton's identity must survive clear_cache()
@@ -794,12 +846,14 @@ class ExtremeConstant(ConstantBase, ABC):
 class Supremum(ExtremeConstant):
     """#sup, the greatest term of clingo's ordering; SUP is the instance."""
 
+    __slots__ = ()
     _TEXT = "#sup"
 
 
 class Infimum(ExtremeConstant):
     """#inf, the least term of clingo's ordering; INF is the instance."""
 
+    __slots__ = ()
     _TEXT = "#inf"
 
 
@@ -990,27 +1044,14 @@ class ExplicitPool(Pool):
         return f"ExplicitPool({plain!r})"
 
     def collect_defined_constants(self) -> set[str]:
-        constants = set()
-
-        for element in self.elements:
-            constants.update(element.collect_defined_constants())
-
-        return constants
+        return set().union(*(element.collect_defined_constants() for element in self.elements))
 
     def collect_variables(self) -> set[str]:
-        variables = set()
-
-        for element in self.elements:
-            variables.update(element.collect_variables())
-
-        return variables
+        return set().union(*(element.collect_variables() for element in self.elements))
 
     def collect_predicate_occurrences(self, *, as_argument: bool) -> set[PredicateOccurrence]:
         # Pool elements are always arguments (a pool is a predicate's data), never atoms
-        occurrences: set[PredicateOccurrence] = set()
-        for element in self.elements:
-            occurrences.update(element.collect_predicate_occurrences(as_argument=True))
-        return occurrences
+        return set().union(*(element.collect_predicate_occurrences(as_argument=True) for element in self.elements))
 
 
 def pool(elements: range | Sequence[int | str | BasicTerm | Expression] | Pool) -> Pool:
@@ -1155,8 +1196,12 @@ class Expression(ComparableTerm, ArithmeticOps, metaclass=_ExpressionMeta):
     # into a teaching error on the accumulation line.
     MAX_DEPTH = 250
 
+    __slots__ = ("_depth", "_first_term", "_operator", "_rendered_body", "_second_term")
+
     # Nesting depth of this node: 1 + its deepest Expression operand
     _depth: int
+    # Set on first render; see _render_body
+    _rendered_body: str
 
     def __init__(
         self,
@@ -1277,26 +1322,18 @@ class Expression(ComparableTerm, ArithmeticOps, metaclass=_ExpressionMeta):
         Each expression renders itself with knowledge of how it sits with respect to its parents.
         Expressions should never look at how their children are situated.
         """
+        expr = self._render_body()
+
         # Handle unary operators first
         if self.operator == Operation.ABS:
             # No parentheses ever needed; absolute value has its own delimiters
-            return f"|{self.second_term.render(RenderingContext.DEFAULT)}|"
+            return expr
 
         if self.operator in (Operation.UNARY_MINUS, Operation.COMPLEMENT):
-            prefix = "-" if self.operator == Operation.UNARY_MINUS else "~"
-            second_str = self.second_term.render(RenderingContext.DEFAULT, self.operator, False)
-            expr = f"{prefix}{second_str}"
             # Need parentheses when it's inside another operation (abs never passes the operation through)
             needs_outer_parentheses = parent_op is not None
             return f"({expr})" if needs_outer_parentheses else expr
 
-        # Must be a binary operation
-        assert self.first_term is not None
-        first_str = self.first_term.render(RenderingContext.DEFAULT, self.operator, False)
-        second_str = self.second_term.render(RenderingContext.DEFAULT, self.operator, True)
-
-        expr = f"{first_str} {self.operator.value} {second_str}"
-
         # Determine if parentheses are needed
         needs_parentheses = False
         if parent_op is not None and (
@@ -1340,6 +1377,44 @@ class Expression(ComparableTerm, ArithmeticOps, metaclass=_ExpressionMeta):
         # Apply parentheses if needed
         return f"({expr})" if needs_parentheses else expr
 
+    def _render_body(self) -> str:
+        """
+        The expression without its own outer parentheses. Only the
+        parentheses depend on where this node sits; the body depends on
+        nothing but the node itself (each child is rendered against THIS
+        node's operator), so it is computed once and stashed. Sound
+        because Expressions are immutable once __init__ returns — the
+        operand folds all happen there. A race between threads rendering
+        the same node is benign: both compute the same string.
+        """
+        try:
+            return self._rendered_body
+        except AttributeError:
+            pass
+
+        if self.operator == Operation.ABS:
+            body = f"|{self.second_term.render(RenderingContext.DEFAULT)}|"
+        elif self.operator in (Operation.UNARY_MINUS, Operation.COMPLEMENT):
+            prefix = "-" if self.operator == Operation.UNARY_MINUS else "~"
+            body = f"{prefix}{self.second_term.render(RenderingContext.DEFAULT, self.operator, False)}"
+        else:
+            # Must be a binary operation
+            assert self.first_term is not None
+            first_str = self.first_term.render(RenderingContext.DEFAULT, self.operator, False)
+            second_str = self.second_term.render(RenderingContext.DEFAULT, self.operator, True)
+            body = f"{first_str} {self.operator.value} {second_str}"
+
+        self._rendered_body = body
+        return body
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """
+        Pickle's state: the operand slots, without the _rendered_body
+        stash. Like Predicate's stashes it is derived, and the next
+        render() rebuilds it.
+        """
+        return None, {slot: getattr(self, slot) for slot in ("_depth", "_first_term", "_operator", "_second_term")}
+
     def validate_in_context(self, is_in_head: bool) -> None:
         """Expressions cannot appear standalone in rule heads or bodies: always raises."""
         raise ValueError("Expressions can only be used as parts of comparisons, assignments, or as predicate arguments")
@@ -1398,6 +1473,8 @@ class Comparison(Negatable):
     relational comparisons (<, <=, >, >=).
     """
 
+    __slots__ = ("_left_term", "_operator", "_right_term")
+
     _left_term: ComparableTerm
     _right_term: ComparableTerm | Pool | PredicateBase
 
@@ -1629,6 +1706,8 @@ class DefaultNegation(Negatable):
     on a Predicate instance flips its sign.
     """
 
+    __slots__ = ("_term",)
+
     def __init__(self, term: Negatable):
         """
         Initialize a default negation, simplifying nested negations:
@@ -84,6 +84,8 @@ class WeakConstraint(ProgramElement):
     shared tuple-set semantics included.
     """
 
+    __slots__ = ("_auto_tuple", "_conditions", "_priority", "_targets")
+
     def __init__(
         self,
         conditions: tuple[Term, ...],
@@ -91,6 +93,7 @@ class WeakConstraint(ProgramElement):
         terms: tuple[TupleTermType, ...] | None,
         priority: int,
     ) -> None:
+        super().__init__()
         weight = _validated_weight(weight, "Weak-constraint")
         # Checked after coercion so Number(-3) is caught the same as -3. A
         # negative weight is legal ASP but turns the penalty into a reward,
@@ -222,6 +225,8 @@ class OptimizationDirective(ProgramElement):
     need the island in the tuple, or they collapse to one contribution).
     """
 
+    __slots__ = ("_element", "_optimization", "_priority")
+
     def __init__(
         self,
         optimization: Optimization,
@@ -230,6 +235,7 @@ class OptimizationDirective(ProgramElement):
         condition: ConditionType | list[ConditionType] | None,
         priority: int,
     ) -> None:
+        super().__init__()
         weight = _validated_weight(weight, "Optimization")
         coerced = tuple(coerce_tuple_term(term, "Optimization") for term in terms)
         _validate_priority(priority, "Optimization")
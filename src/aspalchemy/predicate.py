@@ -9,6 +9,7 @@ from dataclasses import dataclass, fields
 from typing import Any, ClassVar, Never, Self, SupportsIndex, cast, dataclass_transform, get_args, get_origin, overload
 
 from aspalchemy.core import (
+    NAME_CHARACTERS,
     DefaultNegation,
     DefinedConstant,
     ExplicitPool,
@@ -39,6 +40,13 @@ type FieldAsTermType = Value | Predicate | Expression | Pool
 # constraints — exactly coerce_tuple_term's domain
 type TupleTermType = int | str | Value | Expression | Predicate
 
+# The per-atom stashes set through object.__setattr__ (render() and the
+# collectors): derived data, left out of pickled state
+_STASHES = frozenset({"_render_cache", "_constants_cache", "_variables_cache", "_nested_occurrences_cache"})
+
+# A namespace is a lowercase letter followed by name characters.
+_NAMESPACE = re.compile(r"[a-z][A-Za-z0-9_]*")
+
 # Serializes in_namespace()'s clone creation: racing callers must agree on
 # one clone class per (base, namespace)
 _clone_lock = threading.Lock()
@@ -239,7 +247,7 @@ def _validate_schema(name: str, namespace: str, field_names: list[str]) -> None:
     if not name or not name[0].islower():
         raise ValueError(f"Predicate name must start with a lowercase letter: {name}")
 
-    if not all(c.isalnum() or c == "_" for c in name):
+    if not NAME_CHARACTERS.fullmatch(name):
         raise ValueError(f"Predicate name can only contain letters, digits, and underscores: {name}")
 
     if name == "not":
@@ -247,7 +255,7 @@ def _validate_schema(name: str, namespace: str, field_names: list[str]) -> None:
 
     if not namespace.isascii():
         raise ValueError(f"Namespace must be ASCII (gringo's lexer is ASCII-only): {namespace!r}")
-    if namespace and (not namespace[0].islower() or not all(c.isalnum() or c == "_" for c in namespace)):
+    if namespace and not _NAMESPACE.fullmatch(namespace):
         raise ValueError(
             f"Namespace must start with a lowercase letter and contain only letters, "
             f"digits, and underscores: {namespace}"
@@ -335,6 +343,9 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
     # Class-level attributes
     _namespace: ClassVar[str] = ""
     _predicate_name: ClassVar[str]  # set for every subclass by __init_subclass__
+    # The namespaced ASP name get_name() returns, joined once at class creation:
+    # every render of every atom asks for it
+    _asp_name: ClassVar[str]
     # Default visibility, fixed at class creation. Per-program overrides live in
     # ASPProgram (show/hide/show_when); nothing may mutate this after creation.
     _show: ClassVar[bool] = True
@@ -448,6 +459,7 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
                 f"Field[PredicateArg]; other class data must be a ClassVar or an unannotated attribute."
             )
         _validate_schema(cls._predicate_name, namespace, list(ground_types))
+        cls._asp_name = f"{namespace}_{cls._predicate_name}" if namespace else cls._predicate_name
         # dataclass() mutates cls in place (adding __init__ etc.) and returns it;
         # no reassignment is needed. repr=False: the generated __repr__ would
         # shadow Predicate's sign-aware one on every subclass
@@ -665,10 +677,7 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
     @classmethod
     def get_name(cls) -> str:
         """Get the name of this predicate with namespace if any. Case is preserved."""
-        predicate_name = cls._predicate_name
-        if cls._namespace:
-            predicate_name = f"{cls._namespace}_{predicate_name}"
-        return predicate_name
+        return cls._asp_name
 
     @classmethod
     def get_arity(cls) -> int:
@@ -682,8 +691,12 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
 
     @property
     def is_grounded(self) -> bool:
-        """A predicate is grounded if all its arguments are grounded."""
-        return all(arg.is_grounded for arg in self.arguments)
+        """
+        A predicate is grounded if all its arguments are grounded — that is,
+        no variable occurs anywhere in it, so this reads the stashed
+        variable walk (see collect_variables) instead of walking again.
+        """
+        return not self._variable_names()
 
     def render(self, context: RenderingContext = RenderingContext.DEFAULT) -> str:
         # The rendered form is the atom's canonical identity (__eq__ and
@@ -725,13 +738,20 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
         """Predicates are valid in both heads and bodies."""
         pass
 
-    def collect_defined_constants(self) -> set[str]:
-        constants = set()
+    # The collectors below stash their walk on the instance, on the render
+    # cache's terms (see render() for why a stash on a frozen atom is
+    # sound): every render, ground(), and profile re-walks the program, and
+    # an atom's subtree never changes. Unlike the render, none of the
+    # stashes depends on the sign, so __neg__'s duplicate shares them.
+    # Callers get a fresh set each time — they are free to mutate it.
 
-        for arg in self.arguments:
-            constants.update(arg.collect_defined_constants())
-
-        return constants
+    def collect_defined_constants(self) -> set[str]:
+        try:
+            cached: frozenset[str] = self._constants_cache  # type: ignore[attr-defined]
+        except AttributeError:
+            cached = frozenset().union(*(arg.collect_defined_constants() for arg in self.arguments))
+            object.__setattr__(self, "_constants_cache", cached)
+        return set(cached)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -751,12 +771,16 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
         return hash((type(self), self.render()))
 
     def collect_variables(self) -> set[str]:
-        variables = set()
+        return set(self._variable_names())
 
-        for arg in self.arguments:
-            variables.update(arg.collect_variables())
-
-        return variables
+    def _variable_names(self) -> frozenset[str]:
+        """The stashed variable walk, shared by collect_variables() and is_grounded."""
+        try:
+            cached: frozenset[str] = self._variables_cache  # type: ignore[attr-defined]
+        except AttributeError:
+            cached = frozenset().union(*(arg.collect_variables() for arg in self.arguments))
+            object.__setattr__(self, "_variables_cache", cached)
+        return cached
 
     @property
     def negated(self) -> bool:
@@ -777,6 +801,7 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
         for key, value in self.__dict__.items():
             if key == "_render_cache":
                 continue  # the sign changes the render; the duplicate re-renders fresh
+            # (the collector stashes are sign-independent: shared as-is)
             object.__setattr__(negation, key, value)
         object.__setattr__(negation, "_negated", not self.negated)
         return negation
@@ -820,13 +845,22 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
         """
         return self
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle's state: the instance dict minus the render and collector
+        stashes (_STASHES). They are derived from the fields and rebuilt on
+        demand, and the occurrence stash holds predicate class objects that
+        have no business in a pickle.
+        """
+        return {key: value for key, value in self.__dict__.items() if key not in _STASHES}
+
     def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
         """
         Copy goes through the hooks above and never reaches this one —
         this is pickle's alone. An atom pickles by the default machinery
         when its class can be found by name on import (class-syntax
-        predicates at module level): the instance dict carries the sign
-        and the field values, and any Values inside re-intern through
+        predicates at module level): the state (__getstate__) carries the
+        sign and the field values, and any Values inside re-intern through
         their own __reduce__, so identity guarantees survive the round
         trip. A runtime-built class (define()/in_namespace()) cannot be
         found — its __module__ names the caller, but no module attribute
@@ -854,9 +888,15 @@ class Predicate(PredicateBase, Negatable, metaclass=_PredicateMeta):
         # predicate's own arguments are always arguments, so they recurse with
         # as_argument True — still collected, since the converter needs nested
         # classes registered. See Term.collect_predicate_occurrences.
-        occurrences: set[PredicateOccurrence] = {(type(self), self.negated, not as_argument)}
-        for arg in self.arguments:
-            occurrences.update(arg.collect_predicate_occurrences(as_argument=True))
+        # The arguments' part is stashed (see the collector note above): it
+        # depends on neither this atom's sign nor its own as_argument
+        try:
+            nested: frozenset[PredicateOccurrence] = self._nested_occurrences_cache  # type: ignore[attr-defined]
+        except AttributeError:
+            nested = frozenset().union(*(arg.collect_predicate_occurrences(as_argument=True) for arg in self.arguments))
+            object.__setattr__(self, "_nested_occurrences_cache", nested)
+        occurrences = set(nested)
+        occurrences.add((type(self), self.negated, not as_argument))
         return occurrences
 
     def canonical_str(self) -> str:
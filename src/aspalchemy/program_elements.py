@@ -11,16 +11,26 @@ from aspalchemy.source_location import SourceLocation
 
 
 class ProgramElement(ABC):
-    """Base class for any element in an ASP program."""
+    """
+    Base class for any element in an ASP program.
+
+    The hierarchy is slotted: a fact-heavy program holds one element per
+    statement, millions at scale, and an instance __dict__ would be most
+    of each one's footprint. Subclasses declare their own __slots__ and
+    call super().__init__().
+    """
 
-    # Stamped by Segment._append() when location capture is on: the line of
-    # user code that authored this element. For a when()-built element whose
-    # closer sat on a different line, source_location is the when() site and
-    # closed_at is the closer's. Read-only properties: the annotate and
+    # Stamped by Segment._extend() (behind _append) when location capture is
+    # on: the line of user code that authored this element. For a
+    # when()-built element whose closer sat on a different line,
+    # source_location is the when() site and closed_at is the closer's. Read-only properties: the annotate and
     # diagnostics reverse maps depend on these, so only the library writes
     # them (through the private slots).
-    _source_location: SourceLocation | None = None
-    _closed_at: SourceLocation | None = None
+    __slots__ = ("_closed_at", "_source_location")
+
+    def __init__(self) -> None:
+        self._source_location: SourceLocation | None = None
+        self._closed_at: SourceLocation | None = None
 
     @property
     def source_location(self) -> SourceLocation | None:
@@ -63,10 +73,13 @@ class RenderedLine:
 class Comment(ProgramElement):
     """Represents a comment in an ASP program."""
 
+    __slots__ = ("text",)
+
     _locatable = False
 
     def __init__(self, text: str):
         """text may be multi-line."""
+        super().__init__()
         if not isinstance(text, str):
             raise TypeError(f"Comment text must be a string, got {type(text).__name__}")
         # A subclass converts to its natural plain str first, so the check
@@ -263,7 +276,10 @@ class RawASP(ProgramElement):
     -p/n." is emitted (P for positive, -P for negative).
     """
 
+    __slots__ = ("predicates", "text")
+
     def __init__(self, text: str, predicates: Sequence[type[Predicate] | NegatedSignature] = ()):
+        super().__init__()
         if not isinstance(text, str):
             raise TypeError(f"raw_asp() text must be a string, got {type(text).__name__}")
         # A subclass converts to its natural plain str first: what the scan
@@ -336,6 +352,8 @@ class RawASP(ProgramElement):
 class BlankLine(ProgramElement):
     """Represents a blank line in an ASP program for formatting."""
 
+    __slots__ = ()
+
     _locatable = False
 
     def render(self) -> str:
@@ -360,6 +378,8 @@ def render_body_terms(terms: list[Term]) -> str:
 class Rule(ProgramElement):
     """Represents an ASP rule."""
 
+    __slots__ = ("body", "head")
+
     def __init__(self, head: Term | None = None, body: Term | list[Term] | None = None, check_singletons: bool = True):
         """
         Creates a rule.
@@ -375,6 +395,7 @@ class Rule(ProgramElement):
         Raises:
             ValueError: If both head and body are None.
         """
+        super().__init__()
         if head is None and not body:
             # [] slips a None-only check and would render a bare "." (clingo parse error)
             raise ValueError("Cannot have a rule with empty head and body!")
@@ -393,8 +414,11 @@ class Rule(ProgramElement):
 
         # Fail fast on unsafe and singleton variables: the traceback lands on
         # the solver author's line, not in clingo's grounding output. The rule
-        # itself is passed for error text, rendered only if an error needs it
-        validate_rule(self.head, self.body, self, check_singletons=check_singletons)
+        # itself is passed for error text, rendered only if an error needs it.
+        # A ground fact — the bulk of a data-heavy program — has no variables
+        # to scope, so it skips the analysis
+        if self.body or not (isinstance(self.head, Predicate) and self.head.is_grounded):
+            validate_rule(self.head, self.body, self, check_singletons=check_singletons)
 
         # Freeze only now, after ALL validation: a rejected rule must not
         # leave a shared builder locked by a rule that never existed
@@ -404,34 +428,17 @@ class Rule(ProgramElement):
             term.freeze()
 
     def render(self) -> str:
-        result = ""
-
-        if self.head is not None:
-            result += self.head.render()
-
-        if self.body:
-            result += " :- " if self.head is not None else ":- "
-            result += render_body_terms(self.body)
-
-        result += "."
-
-        return result
+        head = "" if self.head is None else self.head.render()
+        if not self.body:
+            # A fact: the constructor guarantees the head
+            return f"{head}."
+        separator = ":- " if self.head is None else " :- "
+        return f"{head}{separator}{render_body_terms(self.body)}."
 
     def collect_defined_constants(self) -> set[str]:
-        constants = set()
-
-        if self.head is not None:
-            constants.update(self.head.collect_defined_constants())
-
-        for term in self.body:
-            constants.update(term.collect_defined_constants())
-
-        return constants
+        terms = self.body if self.head is None else [self.head, *self.body]
+        return set().union(*(term.collect_defined_constants() for term in terms))
 
     def collect_predicate_occurrences(self, *, as_argument: bool) -> set[PredicateOccurrence]:
-        occurrences = (
-            set() if self.head is None else set(self.head.collect_predicate_occurrences(as_argument=as_argument))
-        )
-        for term in self.body:
-            occurrences.update(term.collect_predicate_occurrences(as_argument=as_argument))
-        return occurrences
+        terms = self.body if self.head is None else [self.head, *self.body]
+        return set().union(*(term.collect_predicate_occurrences(as_argument=as_argument) for term in terms))
@@ -20,7 +20,7 @@ is derive(c) — each split just names what the statement means.
 """
 
 import copy
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from typing import Self
 
@@ -140,9 +140,10 @@ class Segment:
     def _append(self, element: ProgramElement) -> None:
         """
         Add an element to the end of the segment. Every statement verb ends
-        here, so this is also where the element is stamped with the user
-        line that authored it (unless the When machinery already did).
-        Formatting elements (_locatable=False) are never stamped.
+        here or, for a batch, in _extend — which is where the element is
+        stamped with the user line that authored it (unless the When
+        machinery already did). Formatting elements (_locatable=False) are
+        never stamped.
 
         Private: elements are internal records — the statement verbs are
         the writing surface, raw_asp() the escape hatch.
@@ -151,9 +152,22 @@ class Segment:
             raise TypeError(
                 f"_append() takes a ProgramElement, got {type(element).__name__}; for verbatim ASP text use raw_asp()"
             )
-        if self._capture_locations and element._locatable and element.source_location is None:
-            element._source_location = capture_location()
-        self._elements.append(element)
+        self._extend((element,))
+
+    def _extend(self, elements: Sequence[ProgramElement]) -> None:
+        """
+        Add already-built elements to the end of the segment, in order,
+        stamping every unstamped locatable one with the authoring line. The
+        stack is walked at most once per batch: one verb call authored all
+        of them.
+        """
+        if self._capture_locations:
+            unstamped = [element for element in elements if element._locatable and element.source_location is None]
+            if unstamped:
+                location = capture_location()
+                for element in unstamped:
+                    element._source_location = location
+        self._elements.extend(elements)
 
     def __len__(self) -> int:
         """The number of statements recorded in this segment."""
@@ -171,23 +185,40 @@ class Segment:
 
     def fact(self, *facts: Predicate) -> None:
         """Add unconditional statements: grounded atoms, asserted true."""
-        for statement in facts:
+        self._add_facts(facts, "fact()")
+
+    def facts(self, atoms: Iterable[Predicate]) -> None:
+        """
+        Add every atom of an iterable as a fact — the bulk twin of fact(),
+        for loading data without unpacking it into an argument tuple. The
+        atoms are validated before any is added, and share one source
+        location: the line that called facts().
+        """
+        self._add_facts(tuple(atoms), "facts()")
+
+    def _add_facts(self, atoms: tuple[Predicate, ...], verb: str) -> None:
+        """
+        Validate and build every atom's rule in one walk, then add them all
+        as one batch (one captured location) through _extend. The checks raise rather
+        than assert: they guard user input, so they must survive -O.
+        """
+        rules = []
+        for statement in atoms:
             if isinstance(statement, Choice):
                 raise TypeError(
                     f"A choice rule ({statement.render()}) is not a fact — nothing is "
                     f"asserted, the solver picks. State it with choose() instead."
                 )
             if not isinstance(statement, Predicate):
-                raise TypeError(f"fact() arguments must be Predicate instances, got {type(statement).__name__}")
+                raise TypeError(f"{verb} arguments must be Predicate instances, got {type(statement).__name__}")
             if not statement.is_grounded:
                 variables = ", ".join(sorted(statement.collect_variables()))
                 raise ValueError(
-                    f"fact() requires grounded predicates, but {statement.render()} contains "
+                    f"{verb} requires grounded predicates, but {statement.render()} contains "
                     f"variable(s) {variables}. Use when(*conditions).derive(...) to derive predicates."
                 )
-        for statement in facts:
-            rule = Rule(head=statement, check_singletons=self._check_singletons)
-            self._append(rule)
+            rules.append(Rule(head=statement, check_singletons=self._check_singletons))
+        self._extend(rules)
 
     def choose(self, choice: Choice) -> None:
         """
@@ -382,7 +413,7 @@ class Segment:
         This is a FRAGMENT: weak constraints render with bare tuples here,
         where the program-level render adds weak-constraint discriminators.
         """
-        return "\n".join(line.text for line in self.render_lines(with_header))
+        return "\n".join([line.text for line in self.render_lines(with_header)])
 
     def render_lines(
         self, with_header: bool, weak_discriminators: Mapping[ProgramElement, int] | None = None
@@ -404,6 +435,10 @@ class Segment:
                 rendered = element.render(discriminator=weak_discriminators.get(element))
             else:
                 rendered = element.render()
+            if "\n" not in rendered:
+                # The common case — one statement, one line — skips the split
+                lines.append(RenderedLine(rendered, element))
+                continue
             # split("\n"), not splitlines(): a trailing newline in raw text
             # must keep contributing its empty line, exactly as when whole
             # rendered elements were joined
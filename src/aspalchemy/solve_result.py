@@ -79,10 +79,11 @@ import sys
 import time
 import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Generator, Iterator, Sequence
+from collections.abc import Callable, Generator, Iterator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass, field
 from enum import StrEnum
+from operator import attrgetter
 from typing import Any, Self, cast, overload
 
 import clingo
@@ -152,9 +153,15 @@ class AtomCollection:
         # _reject_unknown); empty means "no program knowledge", which
         # turns that gate off — a hand-built collection stays permissive.
         self._program_classes = program_classes
-        self._by_class: dict[type[Predicate], list[Predicate]] = {}
+        # Grouped into plain lists — no per-atom hashing (sets come lazily,
+        # below) and no throwaway setdefault([]) list per atom
+        by_class: dict[type[Predicate], list[Predicate]] = {}
         for atom in atoms:
-            self._by_class.setdefault(type(atom), []).append(atom)
+            group = by_class.get(type(atom))
+            if group is None:
+                group = by_class[type(atom)] = []
+            group.append(atom)
+        self._by_class = by_class
         # Membership sets, built lazily per class on the first `in` query
         # (see __contains__): building one hashes every atom of the class
         # (each hash renders once, cached on the atom), and a collection
@@ -947,6 +954,13 @@ def _search_generator(
     # it belongs to the caller, and clingo does no work until we resume
     deadline = time.monotonic() + timeout if timeout > 0 else None
     timed_out = False
+    # Read-back atoms by symbol, for this search only: consecutive answer
+    # sets mostly share their atoms, and an atom is immutable, so each
+    # distinct shown symbol is converted once and the instance shared by
+    # every emission carrying it. Bounded by the grounding's shown atoms,
+    # and released with the generator.
+    converted: dict[clingo.Symbol, Predicate] = {}
+    already_converted = converted.get  # bound once: looked up per shown atom
     final: clingo.SolveResult | None = None
     # Messages before this index belong to parsing/grounding, already policed
     # by the stop threshold; everything after is solve-phase, captured and
@@ -1004,9 +1018,12 @@ def _search_generator(
                     new_messages = message_handler.messages[messages_seen:]
                     messages_seen = len(message_handler.messages)
                     state.messages.extend(new_messages)
-                    atoms = [
-                        convert_symbol_to_predicate(symbol, predicate_types) for symbol in model.symbols(shown=True)
-                    ]
+                    atoms = []
+                    for symbol in model.symbols(shown=True):
+                        atom = already_converted(symbol)
+                        if atom is None:
+                            atom = converted[symbol] = convert_symbol_to_predicate(symbol, predicate_types)
+                        atoms.append(atom)
                     # Variation point: an enumeration emission is an answer
                     # set, a refinement emission a claim-free approximation,
                     # a descent emission an answer set carrying its cost
@@ -1181,59 +1198,35 @@ def convert_predicate_to_symbol(
     return clingo.Function(predicate.get_name(), arguments, positive=not predicate.negated)
 
 
-def convert_symbol_to_predicate(symbol: clingo.Symbol, predicate_types: PredicateTypes) -> Predicate:
-    """
-    Convert a clingo model symbol back into a typed Predicate instance, recursively.
-
-    Raises:
-        ValueError: If the symbol's name/arity doesn't match any known predicate.
-    """
-    if symbol.type != clingo.SymbolType.Function or symbol.name == "":
+# Leaf argument readers, by symbol type: one dict lookup per argument instead
+# of an if-chain that re-reads the native symbol's type on every branch.
+# #sup/#inf are clingo's greatest/least terms — usually the value of a
+# #min/#max over an EMPTY set (the min of nothing is #sup). Function symbols
+# (nested predicates and tuples) are absent: they need the converter's stack.
+_LEAF_READERS: dict[clingo.SymbolType, Callable[[clingo.Symbol], int | str | ExtremeConstant]] = {
+    clingo.SymbolType.Number: attrgetter("number"),
+    clingo.SymbolType.String: attrgetter("string"),
+    clingo.SymbolType.Supremum: lambda _: SUP,
+    clingo.SymbolType.Infimum: lambda _: INF,
+}
+
+
+def _predicate_class(symbol: clingo.Symbol, predicate_types: PredicateTypes) -> type[Predicate]:
+    """The class a function symbol reads back as; ValueError naming the remedy when none is known."""
+    key = (symbol.name, len(symbol.arguments))
+    pred_class = predicate_types.get(key)
+    if pred_class is None:
         raise ValueError(
-            f"Model contains non-predicate output {symbol}: raw #show term forms "
-            f"(#show expr : condition) emit arbitrary terms, which aspalchemy does not "
-            f"model — show atoms instead."
-        )
-    pred_name = symbol.name
-    key = (pred_name, len(symbol.arguments))
-
-    if key not in predicate_types:
-        raise ValueError(
-            f"Unknown predicate type: {pred_name}/{len(symbol.arguments)}. If this atom is "
+            f"Unknown predicate type: {symbol.name}/{len(symbol.arguments)}. If this atom is "
             f"produced by a raw_asp() block, declare its class via raw_asp(..., predicates=[...])."
         )
+    return pred_class
 
-    pred_class = predicate_types[key]
-
-    # Hot path: one instance per solution atom. Arguments are built
-    # positionally in field order (the (name, arity) key already proved the
-    # count matches the class's fields), and no per-atom dataclasses.fields()
-    # walk — cls._field_names is the cached order, and here even the names
-    # are unnecessary.
-    values: list[Predicate | int | str | ExtremeConstant] = []
-    for i, arg in enumerate(symbol.arguments):
-        if arg.type == clingo.SymbolType.Number:
-            values.append(arg.number)
-        elif arg.type == clingo.SymbolType.String:
-            values.append(arg.string)
-        elif arg.type == clingo.SymbolType.Supremum:
-            # #sup/#inf are clingo's greatest/least terms — usually the value
-            # of a #min/#max over an EMPTY set (the min of nothing is #sup)
-            values.append(SUP)
-        elif arg.type == clingo.SymbolType.Infimum:
-            values.append(INF)
-        else:
-            # Function is the last symbol type; tuples are its nameless form
-            if arg.name == "":
-                # A clingo tuple argument, not a #show term form: diagnose the
-                # actual limitation instead of blaming the (real) atom around it
-                raise ValueError(
-                    f"Argument {i} of {pred_name} is the clingo tuple {arg}, which aspalchemy "
-                    f"does not model — wrap it in a named predicate (pair{arg} instead of {arg})."
-                )
-            # Recursively convert nested predicates; bare atoms are nullary predicates
-            values.append(convert_symbol_to_predicate(arg, predicate_types))
 
+def _construct_predicate(
+    symbol: clingo.Symbol, pred_class: type[Predicate], values: list[Predicate | int | str | ExtremeConstant]
+) -> Predicate:
+    """Instantiate one read-back atom from its converted arguments, naming the atom if the class refuses them."""
     try:
         instance = pred_class(*values)
     except (TypeError, ValueError) as e:
@@ -1243,9 +1236,64 @@ def convert_symbol_to_predicate(symbol: clingo.Symbol, predicate_types: Predicat
         # kept — a type mismatch stays a TypeError.
         raise type(e)(
             f"Model atom {symbol} cannot be read back as {pred_class.__name__} "
-            f"({pred_name}/{len(symbol.arguments)}): {e} (One unreadable atom "
+            f"({symbol.name}/{len(symbol.arguments)}): {e} (One unreadable atom "
             f"fails the whole model read: hide() the class to keep the rest "
             f"readable, or keep such values out of raw text and @-functions — "
             f"aspalchemy has no escaping support.)"
         ) from e
     return -instance if symbol.negative else instance
+
+
+def convert_symbol_to_predicate(symbol: clingo.Symbol, predicate_types: PredicateTypes) -> Predicate:
+    """
+    Convert a clingo model symbol back into a typed Predicate instance,
+    nested predicates included.
+
+    Raises:
+        ValueError: If the symbol's name/arity doesn't match any known predicate.
+    """
+    if symbol.type != clingo.SymbolType.Function or symbol.name == "":
+        raise ValueError(
+            f"Model contains non-predicate output {symbol}: raw #show term forms "
+            f"(#show expr : condition) emit arbitrary terms, which aspalchemy does not "
+            f"model — show atoms instead."
+        )
+
+    # Hot path: one instance per solution atom. Arguments are built
+    # positionally in field order (the (name, arity) key already proved the
+    # count matches the class's fields), and no per-atom dataclasses.fields()
+    # walk — cls._field_names is the cached order, and here even the names
+    # are unnecessary. Nested predicates are converted depth-first on an
+    # explicit stack rather than by recursion: no Python frame per nesting
+    # level, and no RecursionError however deep the term. Each frame is one
+    # function symbol still collecting its arguments.
+    stack: list[
+        tuple[clingo.Symbol, type[Predicate], list[clingo.Symbol], list[Predicate | int | str | ExtremeConstant]]
+    ] = [(symbol, _predicate_class(symbol, predicate_types), symbol.arguments, [])]
+    while True:
+        current, pred_class, arguments, values = stack[-1]
+        while len(values) < len(arguments):
+            arg = arguments[len(values)]
+            reader = _LEAF_READERS.get(arg.type)
+            if reader is not None:
+                values.append(reader(arg))
+            else:
+                # Function is the only symbol type left; tuples are its nameless form
+                if arg.name == "":
+                    # A clingo tuple argument, not a #show term form: diagnose the
+                    # actual limitation instead of blaming the (real) atom around it
+                    raise ValueError(
+                        f"Argument {len(values)} of {current.name} is the clingo tuple {arg}, which "
+                        f"aspalchemy does not model — wrap it in a named predicate (pair{arg} "
+                        f"instead of {arg})."
+                    )
+                # A nested predicate (bare atoms are nullary predicates):
+                # convert it first, then resume this frame
+                stack.append((arg, _predicate_class(arg, predicate_types), arg.arguments, []))
+                break
+        else:
+            stack.pop()
+            instance = _construct_predicate(current, pred_class, values)
+            if not stack:
+                return instance
+            stack[-1][3].append(instance)
@@ -6,7 +6,7 @@ import sys
 import tempfile
 import threading
 import time
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, Self
 
 import clingo
@@ -115,6 +115,26 @@ def _head_classes(head: Term) -> set[type[Predicate]]:
     return set()
 
 
+def _derived_classes(element: ProgramElement) -> set[type[Predicate]]:
+    """The classes a statement derives, for analyze_grounding(): rule head classes, or a raw block's declarations."""
+    if isinstance(element, Rule) and element.head is not None:
+        return _head_classes(element.head)
+    if isinstance(element, RawASP):
+        return {entry.predicate if isinstance(entry, NegatedSignature) else entry for entry in element.predicates}
+    return set()
+
+
+def _join_lines(lines: list[RenderedLine]) -> str:
+    """
+    The program text: every line newline-terminated. The trailing newline
+    rides the join as an empty last line, so a multi-megabyte program is
+    built in one allocation rather than joined and then copied by a +.
+    """
+    texts = [line.text for line in lines]
+    texts.append("")
+    return "\n".join(texts)
+
+
 def _validate_timeout(timeout: float) -> None:
     """The timeout checks, shared by _begin_solve and the sugar verbs (cheap checks before grounding is paid for)."""
     if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
@@ -274,7 +294,7 @@ def _annotate_lines(lines: list[RenderedLine]) -> list[RenderedLine]:
     same character-level scan raw_asp validation uses, so blocks opening
     or closing mid-line are honored.
     """
-    text = "\n".join(line.text for line in lines)
+    text = "\n".join([line.text for line in lines])
     spans = script_spans(text)
     starts: list[int] = []
     position = 0
@@ -339,12 +359,18 @@ class ASPProgram:
         self._source_locations = source_locations
         self._segments: dict[str, Segment] = {}
         self._defined_constants: dict[str, int | str | Predicate] = {}
+        # The rendered #const lines, built on first render and dropped on the
+        # next define_constant() (constants are register-only, so that is the
+        # one invalidation point)
+        self._constant_lines: tuple[str, ...] | None = None
         self._show_overrides: dict[type[Predicate], bool] = {}
         self._project_shown = False
         # Conditional shows are per SIGN: (class, negated) -> the directive's
         # conditional literal. Each sign's visibility resolves independently:
         # its conditional override, else the class's bool override/default.
         self._show_when_overrides: dict[tuple[type[Predicate], bool], ConditionalLiteral] = {}
+        # The default segment object, resolved on first use (see _default_segment)
+        self._default_segment_cache: Segment | None = None
         # The three assignable attributes go through their property setters,
         # so post-construction assignment gets the same validation
         self.header = header
@@ -419,17 +445,27 @@ class ASPProgram:
     @default_segment.setter
     def default_segment(self, name: str) -> None:
         self._default_segment_name = Segment.validate_name(name)
+        self._default_segment_cache = None
 
     def _default_segment(self) -> Segment:
-        """The default segment, created on first use; every other segment needs add_segment."""
-        key = self.default_segment
-        if key not in self._segments:
-            self._segments[key] = Segment(
-                key,
-                allow_singletons=not self._check_singletons,
-                source_locations=self._source_locations,
-            )
-        return self._segments[key]
+        """
+        The default segment, created on first use; every other segment needs
+        add_segment. Every program-level verb comes through here, so the
+        object is cached — dropped whenever the name is reassigned or the
+        segment under it is replaced or deleted.
+        """
+        segment = self._default_segment_cache
+        if segment is None:
+            key = self._default_segment_name
+            segment = self._segments.get(key)
+            if segment is None:
+                segment = self._segments[key] = Segment(
+                    key,
+                    allow_singletons=not self._check_singletons,
+                    source_locations=self._source_locations,
+                )
+            self._default_segment_cache = segment
+        return segment
 
     def _segment_listing(self) -> str:
         """The existing segment names, quoted, for KeyError messages ("none" when empty)."""
@@ -472,6 +508,7 @@ class ASPProgram:
                 f"create segments with add_segment(). Existing segments: {self._segment_listing()}"
             )
         self._segments[key] = value
+        self._default_segment_cache = None
 
     def __contains__(self, segment: str) -> bool:
         """Whether a segment with this name exists (membership is by name, like a dict's)."""
@@ -553,11 +590,16 @@ class ASPProgram:
         existing segments) if absent. Existing groundings are unaffected.
         """
         del self._segments[self._existing_segment_key(segment)]
+        self._default_segment_cache = None
 
     def fact(self, *facts: Predicate) -> None:
         """Add unconditional statements to the default segment; see Segment.fact()."""
         self._default_segment().fact(*facts)
 
+    def facts(self, atoms: Iterable[Predicate]) -> None:
+        """Add every atom of an iterable as a fact to the default segment; see Segment.facts()."""
+        self._default_segment().facts(atoms)
+
     def choose(self, choice: Choice) -> None:
         """Add a bare choice rule to the default segment; see Segment.choose()."""
         self._default_segment().choose(choice)
@@ -677,6 +719,7 @@ class ASPProgram:
                 )
 
         self._defined_constants[name] = value
+        self._constant_lines = None
 
         return constant
 
@@ -755,10 +798,6 @@ class ASPProgram:
         condition.freeze()
         self._show_when_overrides[key] = condition
 
-    def _has_raw_asp(self) -> bool:
-        """Whether any segment contains a RawASP block (raw text is invisible to the tree walkers)."""
-        return any(isinstance(element, RawASP) for segment in self._segments.values() for element in segment)
-
     def _validate_shown_predicates(self, segment_occurrences: set[PredicateOccurrence], has_raw: bool) -> None:
         """
         Raise for show()/show_when() of atoms nothing derives — but only when
@@ -834,7 +873,7 @@ class ASPProgram:
         golden-compared renders unannotated.
         """
         lines, _all_classes, _has_raw = self._render_lines(annotate=annotate)
-        return "\n".join(line.text for line in lines) + "\n"
+        return _join_lines(lines)
 
     def _render_with_origins(
         self,
@@ -845,11 +884,13 @@ class ASPProgram:
         bool,
         dict[int, tuple[str, SourceLocation | None, str]],
         dict[int, SourceLocation | None],
+        dict[tuple[str, int], list[SourceLocation | None]],
     ]:
         """
         The rendered program, a 1-based line -> authoring-location map for
         grounding diagnostics, the walk products ground() reuses (the
-        program's full class universe, whether raw blocks exist), and the
+        program's full class universe, whether raw blocks exist, and each
+        signature's deriving statements), and the
         statement profiler's structural classification: a line ->
         (statement text, location, kind) table for every rendered Rule
         and WeakConstraint
@@ -857,7 +898,8 @@ class ASPProgram:
         nothing is re-derived from text) plus the raw-block line map that
         takes the residual textual pass.
         """
-        lines, all_classes, has_raw = self._render_lines(annotate=False)
+        derivation_sites: dict[tuple[str, int], list[SourceLocation | None]] = {}
+        lines, all_classes, has_raw = self._render_lines(annotate=False, derivation_sites=derivation_sites)
         origins = {
             line_number: line.element.source_location
             for line_number, line in enumerate(lines, start=1)
@@ -865,15 +907,20 @@ class ASPProgram:
         }
         statement_table, raw_locations = analysis.classify_statements(lines)
         return (
-            "\n".join(line.text for line in lines) + "\n",
+            _join_lines(lines),
             origins,
             all_classes,
             has_raw,
             statement_table,
             raw_locations,
+            derivation_sites,
         )
 
-    def _render_lines(self, annotate: bool) -> tuple[list[RenderedLine], set[type[Predicate]], bool]:
+    def _render_lines(
+        self,
+        annotate: bool,
+        derivation_sites: dict[tuple[str, int], list[SourceLocation | None]] | None = None,
+    ) -> tuple[list[RenderedLine], set[type[Predicate]], bool]:
         """
         Every rendered line carrying the element that produced it
         (program-level lines carry None) — plus the class universe and the
@@ -882,16 +929,49 @@ class ASPProgram:
         (segment elements, show_when conditions, show()/hide() overrides):
         it is the reconstruction registry and the raw_asp declaration
         contract's world — naming a class to show() declares it as fully
-        as predicates= does.
-        """
+        as predicates= does. Given a derivation_sites map (ground() does),
+        the same walk fills it: signature -> authoring lines of the
+        statements deriving it.
+        """
+        # One walk over every element gathers everything validation and the
+        # show block need — predicate occurrences (the render's hot spot,
+        # shared by both validators and the show block below), referenced
+        # constants, raw-block presence, and the weak-constraint ordinals —
+        # rather than a pass apiece. Segment elements are top-level
+        # statements, so their occurrences are atom-position.
+        #
+        # Weak constraints: discriminate auto-tupled ones program-wide, in
+        # document order: two statements' coinciding ground tuples must not
+        # merge charges in the shared tuple set. A program-level concern like
+        # the #show block, computed fresh into a render-local map each render
+        # — rendering never mutates elements, so programs sharing a segment
+        # cannot interfere, however they are threaded. Uniqueness within one
+        # render is the guarantee; ordinals stay stable across renders while
+        # the program only appends (deleting or replacing a segment shifts
+        # later ordinals).
+        segment_occurrences: set[PredicateOccurrence] = set()
+        used_constants: set[str] = set()
+        has_raw = False
+        weak_discriminators: dict[ProgramElement, int] = {}
         for segment in self._segments.values():
             segment.check_pending()
-        self._validate_constants()
-        # The predicate-occurrence walk is the render's hot spot: computed
-        # once here, shared by both validators and the show block below
-        segment_occurrences = {
-            occ for segment in self._segments.values() for occ in segment.collect_predicate_occurrences()
-        }
+            for element in segment:
+                segment_occurrences.update(element.collect_predicate_occurrences(as_argument=False))
+                used_constants.update(element.collect_defined_constants())
+                if isinstance(element, RawASP):
+                    has_raw = True
+                elif isinstance(element, WeakConstraint) and element.auto_tuple:
+                    weak_discriminators[element] = len(weak_discriminators)
+                if derivation_sites is not None:
+                    for cls in _derived_classes(element):
+                        derivation_sites.setdefault((cls.get_name(), cls.get_arity()), []).append(
+                            element.source_location
+                        )
+        for condition in self._show_when_overrides.values():
+            used_constants.update(condition.collect_defined_constants())
+        if unregistered := used_constants - self._defined_constants.keys():
+            raise ValueError(f"Undefined constants used in program: {', '.join(sorted(unregistered))}")
+
         show_when_occurrences = {
             occ
             for condition in self._show_when_overrides.values()
@@ -910,25 +990,9 @@ class ASPProgram:
                 for cls in value.collect_predicates()
             }
         )
-        has_raw = self._has_raw_asp()
         self._validate_names(all_classes)
         self._validate_shown_predicates(segment_occurrences, has_raw)
 
-        # Discriminate auto-tupled weak constraints program-wide, in document
-        # order: two statements' coinciding ground tuples must not merge
-        # charges in the shared tuple set. A program-level concern like the
-        # #show block, computed fresh into a render-local map each render —
-        # rendering never mutates elements, so programs sharing a segment
-        # cannot interfere, however they are threaded. Uniqueness within one
-        # render is the guarantee; ordinals stay stable across renders while
-        # the program only appends (deleting or replacing a segment shifts
-        # later ordinals).
-        weak_discriminators: dict[ProgramElement, int] = {}
-        for segment in self._segments.values():
-            for element in segment:
-                if isinstance(element, WeakConstraint) and element.auto_tuple:
-                    weak_discriminators[element] = len(weak_discriminators)
-
         # 1. Header comments
         lines: list[str] = []
         if self.header:
@@ -939,16 +1003,8 @@ class ASPProgram:
             # running this file with raw clingo needs --project=show
             lines.append("% Solution identity: projected onto shown atoms (run raw clingo with --project=show)")
 
-        # 2. #const definitions. Every registered constant is emitted: the tree
-        # walkers cannot see into raw_asp text, so filtering to "used" constants
-        # silently dropped declarations that raw blocks relied on
-        for name, value in self._defined_constants.items():
-            if isinstance(value, str):
-                lines.append(f'#const {name} = "{value}".')  # String values are quoted
-            elif isinstance(value, Predicate):
-                lines.append(f"#const {name} = {value.render()}.")  # a bare atom: a symbolic constant
-            else:
-                lines.append(f"#const {name} = {value}.")  # Integer values are not
+        # 2. #const definitions
+        lines.extend(self._render_constant_lines())
 
         rendered: list[RenderedLine] = [RenderedLine(line, None) for line in lines]
 
@@ -1005,24 +1061,24 @@ class ASPProgram:
 
         return rendered, all_classes, has_raw
 
-    def _collect_used_defined_constants(self) -> set[str]:
-        """Collect all defined constant names used anywhere in the program."""
-        constants = set()
-
-        for segment in self._segments.values():
-            constants.update(segment.collect_defined_constants())
-
-        for condition in self._show_when_overrides.values():
-            constants.update(condition.collect_defined_constants())
-
-        return constants
-
-    def _validate_constants(self) -> None:
-        """Raise if any constant used in the program was never declared via define_constant()."""
-        used_constants = self._collect_used_defined_constants()
-
-        if unregistered := used_constants - set(self._defined_constants.keys()):
-            raise ValueError(f"Undefined constants used in program: {', '.join(sorted(unregistered))}")
+    def _render_constant_lines(self) -> tuple[str, ...]:
+        """
+        The #const definition lines, memoized until the next define_constant().
+        Every registered constant is emitted: the tree walkers cannot see into
+        raw_asp text, so filtering to "used" constants silently dropped
+        declarations that raw blocks relied on.
+        """
+        if self._constant_lines is None:
+            lines: list[str] = []
+            for name, value in self._defined_constants.items():
+                if isinstance(value, str):
+                    lines.append(f'#const {name} = "{value}".')  # String values are quoted
+                elif isinstance(value, Predicate):
+                    lines.append(f"#const {name} = {value.render()}.")  # a bare atom: a symbolic constant
+                else:
+                    lines.append(f"#const {name} = {value}.")  # Integer values are not
+            self._constant_lines = tuple(lines)
+        return self._constant_lines
 
     def recursion_profile(self) -> tuple[RecursiveComponent, ...]:
         """
@@ -1082,7 +1138,9 @@ class ASPProgram:
         """
         _validate_stop_level(stop_on_log_level)
         ground_started = time.perf_counter()
-        asp_source, line_origins, all_classes, has_raw, statement_table, raw_locations = self._render_with_origins()
+        asp_source, line_origins, all_classes, has_raw, statement_table, raw_locations, derivation_sites = (
+            self._render_with_origins()
+        )
 
         message_handler = ClingoMessageHandler(asp_source, stop_on_level=stop_on_log_level, line_origins=line_origins)
         control = clingo.Control(logger=message_handler.on_message, arguments=["--stats"])
@@ -1092,6 +1150,10 @@ class ASPProgram:
         observer = _MinimizeLevelObserver()
         control.register_observer(observer)
 
+        # Facts travel in the text with everything else, never through
+        # control.backend(): backend atoms skip gringo's domains, so rules
+        # over them would never instantiate — and the handle's text, its
+        # gringo re-runs, and the profilers all promise the whole program
         try:
             control.add("base", [], asp_source)
         except RuntimeError as e:
@@ -1129,8 +1191,9 @@ class ASPProgram:
                 "optimizing programs."
             )
         if self.project_shown:
-            assert isinstance(control.configuration.solve, clingo.Configuration)
-            control.configuration.solve.project = "show"
+            solve_config = control.configuration.solve
+            assert isinstance(solve_config, clingo.Configuration)
+            solve_config.project = "show"
 
         predicate_types = {(pred.get_name(), pred.get_arity()): pred for pred in all_classes}
 
@@ -1145,23 +1208,6 @@ class ASPProgram:
             and not any((pred, negated) in self._show_when_overrides for negated in (False, True))
         )
 
-        # Deriving statements by signature, for analyze_grounding(): each
-        # rule head's classes and each raw block's declared classes, joined
-        # to the source lines that authored them
-        derivation_sites: dict[tuple[str, int], list[SourceLocation | None]] = {}
-        for segment in self._segments.values():
-            for element in segment:
-                classes: set[type[Predicate]] = set()
-                if isinstance(element, Rule) and element.head is not None:
-                    classes = _head_classes(element.head)
-                elif isinstance(element, RawASP):
-                    classes = {
-                        entry.predicate if isinstance(entry, NegatedSignature) else entry
-                        for entry in element.predicates
-                    }
-                for cls in classes:
-                    derivation_sites.setdefault((cls.get_name(), cls.get_arity()), []).append(element.source_location)
-
         # Raw text is invisible to the walkers, so with raw blocks present
         # the raw_asp contract (exhaustive declaration) is enforced here,
         # against gringo's own signature table: every ground signature must
@@ -1214,7 +1260,10 @@ class ASPProgram:
 
         Sugar for ground().solve(): renders and grounds a fresh Control every
         call. For solving one program many times, call ground() once and
-        solve the returned handle repeatedly.
+        solve the returned handle repeatedly. There is deliberately no hidden
+        grounding cache here: a reused Control runs one search at a time, so
+        two open results from this program would collide where today they
+        are independent.
 
         The stream is unbounded: take what you need (next(iter(result)) for
         one model, itertools.islice for N, a for-loop with break for a
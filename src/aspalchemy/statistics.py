@@ -12,9 +12,18 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
     Most of these statistics are output in https://github.com/potassco/clasp/blob/master/clasp/solver_types.h
     if you want to see the original calculations!
     """
+    # Each section reads one subtree of the schema: resolve the subtrees
+    # once rather than re-walking the path from the root for every value
+    summary = stats["summary"]
+    times = summary["times"]
+    solvers = stats["solving"]["solvers"]
+    problem = stats["problem"]
+    lp = problem["lp"]
+    generator = problem["generator"]
+
     # Models and Calls
-    models_enumerated = int(stats["summary"]["models"]["enumerated"])
-    calls = int(stats["summary"]["call"]) + 1  # clingo seems to add 1
+    models_enumerated = int(summary["models"]["enumerated"])
+    calls = int(summary["call"]) + 1  # clingo seems to add 1
     lines = [
         f"Models       : {models_enumerated}",
         f"Calls        : {calls}",
@@ -22,10 +31,10 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
 
     # Time information
     wall_time = stats["wall_time"]
-    solving_time = stats["summary"]["times"]["solve"]
-    sat_time = stats["summary"]["times"].get("sat", 0)
-    unsat_time = stats["summary"]["times"].get("unsat", 0)
-    cpu_time = stats["summary"]["times"]["cpu"]
+    solving_time = times["solve"]
+    sat_time = times.get("sat", 0)
+    unsat_time = times.get("unsat", 0)
+    cpu_time = times["cpu"]
 
     lines.extend(
         (
@@ -37,9 +46,9 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
     )
 
     # Choices and Conflicts
-    choices = int(stats["solving"]["solvers"]["choices"])
-    conflicts = int(stats["solving"]["solvers"]["conflicts"])
-    conflicts_analyzed = int(stats["solving"]["solvers"]["conflicts_analyzed"])
+    choices = int(solvers["choices"])
+    conflicts = int(solvers["conflicts"])
+    conflicts_analyzed = int(solvers["conflicts_analyzed"])
 
     lines.extend(
         (
@@ -48,9 +57,9 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
         )
     )
     # Restarts
-    restarts = int(stats["solving"]["solvers"]["restarts"])
-    restarts_last = int(stats["solving"]["solvers"]["restarts_last"])
-    restarts_blocked = int(stats["solving"]["solvers"]["restarts_blocked"])
+    restarts = int(solvers["restarts"])
+    restarts_last = int(solvers["restarts_last"])
+    restarts_blocked = int(solvers["restarts_blocked"])
     avg_restart = (conflicts_analyzed / restarts) if restarts > 0 else 0
 
     lines.append(
@@ -58,7 +67,7 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
     )
 
     # Model-Level and Problems
-    extra = stats["solving"]["solvers"].get("extra", {})
+    extra = solvers.get("extra", {})
     if "models_level" in extra:
         model_level = extra["models_level"]
         lines.append(f"Model-Level  : {model_level}")
@@ -151,9 +160,9 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
         )
 
     # Rules
-    rules_original = int(stats["problem"]["lp"]["rules"])
-    rules_transformed = int(stats["problem"]["lp"]["rules_tr"])
-    choice_rules = int(stats["problem"]["lp"]["rules_choice"])
+    rules_original = int(lp["rules"])
+    rules_transformed = int(lp["rules_tr"])
+    choice_rules = int(lp["rules_choice"])
 
     lines.extend(
         (
@@ -163,8 +172,8 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
     )
 
     # Atoms - show original and auxiliary breakdown like clingo
-    atoms_total = int(stats["problem"]["lp"]["atoms"])
-    atoms_aux = int(stats["problem"]["lp"]["atoms_aux"])
+    atoms_total = int(lp["atoms"])
+    atoms_aux = int(lp["atoms_aux"])
     atoms_original = atoms_total - atoms_aux
 
     if atoms_aux > 0:
@@ -173,10 +182,10 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
         lines.append(f"Atoms        : {atoms_total:<8}")
 
     # Bodies
-    bodies_original = int(stats["problem"]["lp"]["bodies"])
-    bodies_transformed = int(stats["problem"]["lp"]["bodies_tr"])
-    count_bodies_original = int(stats["problem"]["lp"]["count_bodies"])
-    count_bodies_transformed = int(stats["problem"]["lp"]["count_bodies_tr"])
+    bodies_original = int(lp["bodies"])
+    bodies_transformed = int(lp["bodies_tr"])
+    count_bodies_original = int(lp["count_bodies"])
+    count_bodies_transformed = int(lp["count_bodies_tr"])
 
     lines.extend(
         (
@@ -186,18 +195,18 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
     )
 
     # Equivalences
-    eqs_total = int(stats["problem"]["lp"]["eqs"])
-    eqs_atom = int(stats["problem"]["lp"]["eqs_atom"])
-    eqs_body = int(stats["problem"]["lp"]["eqs_body"])
-    eqs_other = int(stats["problem"]["lp"]["eqs_other"])
+    eqs_total = int(lp["eqs"])
+    eqs_atom = int(lp["eqs_atom"])
+    eqs_body = int(lp["eqs_body"])
+    eqs_other = int(lp["eqs_other"])
 
     lines.append(f"Equivalences : {eqs_total:<8} (Atom=Atom: {eqs_atom} Body=Body: {eqs_body} Other: {eqs_other})")
 
     # Tight
-    sccs = int(stats["problem"]["lp"]["sccs"])
-    sccs_non_hcf = int(stats["problem"]["lp"]["sccs_non_hcf"])
-    ufs_nodes = int(stats["problem"]["lp"]["ufs_nodes"])
-    gammas = int(stats["problem"]["lp"]["gammas"])
+    sccs = int(lp["sccs"])
+    sccs_non_hcf = int(lp["sccs_non_hcf"])
+    ufs_nodes = int(lp["ufs_nodes"])
+    gammas = int(lp["gammas"])
     tight = "Yes" if sccs == 0 else "No"
 
     lines.append(
@@ -205,17 +214,17 @@ def format_statistics_clingo_style(stats: dict[str, Any]) -> str:
     )
 
     # Variables
-    vars_total = int(stats["problem"]["generator"]["vars"])
-    vars_eliminated = int(stats["problem"]["generator"]["vars_eliminated"])
-    vars_frozen = int(stats["problem"]["generator"]["vars_frozen"])
+    vars_total = int(generator["vars"])
+    vars_eliminated = int(generator["vars_eliminated"])
+    vars_frozen = int(generator["vars_frozen"])
 
     lines.append(f"Variables    : {vars_total:<8} (Eliminated: {vars_eliminated:4d} Frozen: {vars_frozen})")
 
     # Constraints
     # Total constraints = binary + ternary + other
-    constraints_binary = int(stats["problem"]["generator"]["constraints_binary"])
-    constraints_ternary = int(stats["problem"]["generator"]["constraints_ternary"])
-    constraints_other = int(stats["problem"]["generator"]["constraints"])
+    constraints_binary = int(generator["constraints_binary"])
+    constraints_ternary = int(generator["constraints_ternary"])
+    constraints_other = int(generator["constraints"])
     constraints_total = constraints_binary + constraints_ternary + constraints_other
 
     if constraints_total > 0:
@@ -504,6 +504,36 @@ def test_expressions_still_copy_and_pickle() -> None:
     assert pickle.loads(pickle.dumps(expression)).render() == "X + 1"
 
 
+def test_composite_terms_carry_no_instance_dict() -> None:
+    """Expressions, comparisons, and negations are built per rule: slotted, and still copyable."""
+    X = Variable("X")
+    P = Predicate.define("p_slotted", ["x"])
+    for term in (X + 1, X < 3, Not(P(x=X))):
+        assert not hasattr(term, "__dict__")
+        assert copy.copy(term).render() == term.render()
+    assert pickle.loads(pickle.dumps(X < 3)).render() == "X < 3"
+
+
+def test_a_shared_subexpression_parenthesizes_per_parent() -> None:
+    """The node's rendered body is stashed; only its parentheses depend on where it sits."""
+    X = Variable("X")
+    shared = X - 1
+    assert shared.render() == "X - 1"
+    assert (shared * 2).render() == "(X - 1) * 2"
+    assert (2 - shared).render() == "2 - (X - 1)"
+    assert (shared + 2).render() == "X - 1 + 2"
+    assert (-abs(shared)).render() == "-|X - 1|"
+
+
+def test_pickle_leaves_the_rendered_body_behind() -> None:
+    expression = Variable("X") + 1
+    assert expression.render() == "X + 1"
+    assert b"_rendered_body" not in pickle.dumps(expression)
+    loaded = pickle.loads(pickle.dumps(expression))
+    assert not hasattr(loaded, "_rendered_body")
+    assert loaded.render() == "X + 1"
+
+
 def test_the_collapse_fires_under_every_parent() -> None:
     """The old wart: -(-X) unwrapped only under an additive parent. The collapse is unconditional."""
     X, Y = Variable("X"), Variable("Y")
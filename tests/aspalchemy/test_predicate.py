@@ -4,7 +4,18 @@ import pickle
 
 import pytest
 
-from aspalchemy import ASPProgram, Comparison, DefaultNegation, Field, Number, Predicate, PredicateArg, Variable, pool
+from aspalchemy import (
+    ASPProgram,
+    Comparison,
+    DefaultNegation,
+    DefinedConstant,
+    Field,
+    Number,
+    Predicate,
+    PredicateArg,
+    Variable,
+    pool,
+)
 
 
 class CluePred(Predicate):
@@ -75,6 +86,24 @@ def test_class_syntax_atoms_round_trip_through_pickle() -> None:
     assert untyped["x"] is Number(5)  # the stored Number is the cache resident again
 
 
+def test_pickle_leaves_the_stashes_behind() -> None:
+    # The render and collector stashes are derived data: the pickled state
+    # is the sign and the fields alone, and the loaded atom rebuilds the
+    # same answers on demand
+    atom = UntypedPkl(x=UntypedPkl(x=DefinedConstant("n")))
+    occurrences = atom.collect_predicate_occurrences(as_argument=False)
+    constants = atom.collect_defined_constants()
+    atom.collect_variables()
+    atom.render()
+    loaded = pickle.loads(pickle.dumps(atom))
+    assert vars(loaded) == atom.__getstate__()
+    assert not any(key.endswith("_cache") for key in vars(loaded))
+    assert loaded.collect_predicate_occurrences(as_argument=False) == occurrences
+    assert loaded.collect_defined_constants() == constants
+    assert loaded.collect_variables() == set()
+    assert loaded.render() == "untyped_pkl(untyped_pkl(n))"
+
+
 def test_copies_of_an_atom_are_the_atom() -> None:
     # Predicates are immutable data: copy and deepcopy return the original,
     # exactly as for interned Values
@@ -122,6 +151,35 @@ def test_render_cache_never_leaks_through_atom_producing_paths() -> None:
     assert fresh.render() == 'clue_pred("b2", 1)'
 
 
+def test_collector_stashes_hand_out_fresh_sets() -> None:
+    # The collectors stash their walk on the frozen atom; callers still get
+    # a set of their own to mutate, and the sign flip keeps its own top-level
+    # occurrence while sharing the nested part
+    Cell = Predicate.define("cell_stash", ["row"])
+    Mark = Predicate.define("mark_stash", ["at"])
+    atom = Mark(at=Cell(row=Variable("R")))
+    variables = atom.collect_variables()
+    variables.add("Z")
+    assert atom.collect_variables() == {"R"}
+    occurrences = atom.collect_predicate_occurrences(as_argument=False)
+    assert occurrences == {(Mark, False, True), (Cell, False, False)}
+    occurrences.clear()
+    assert (-atom).collect_predicate_occurrences(as_argument=False) == {(Mark, True, True), (Cell, False, False)}
+    assert atom.collect_predicate_occurrences(as_argument=True) == {(Mark, False, False), (Cell, False, False)}
+
+
+def test_is_grounded_reads_the_variable_walk() -> None:
+    # Grounded means no variable anywhere, however deep — expressions, pools,
+    # and nested atoms included, ANY counting as a variable
+    Cell = Predicate.define("cell_ground", ["row"])
+    Mark = Predicate.define("mark_ground", ["at"])
+    assert Mark(at=Cell(row=Number(2) + 1)).is_grounded
+    assert Mark(at=pool([1, 2])).is_grounded
+    assert not Mark(at=Cell(row=Variable("R") + 1)).is_grounded
+    assert not Mark(at=Cell(row=Variable("_"))).is_grounded
+    assert not (-Mark(at=pool([1, Variable("R")]))).is_grounded
+
+
 def test_predicate_default_negation_operator() -> None:
     """Test the ~ operator creates DefaultNegation."""
     Person = Predicate.define("person", ["name"])
@@ -138,6 +138,16 @@ def test_atom_valued_const_renders_bare_and_reads_back_typed() -> None:
     assert facing["d"] == N()  # the symbol reconstructs typed, not as a string
 
 
+def test_const_block_tracks_later_definitions() -> None:
+    # The #const lines are memoized between renders; a later definition
+    # must still reach the next render, in registration order
+    program = ASPProgram()
+    program.define_constant("n", 3)
+    assert "#const n = 3." in program.render()
+    program.define_constant("label", "x")
+    assert '#const n = 3.\n#const label = "x".' in program.render()
+
+
 def test_atom_valued_const_values_must_be_ground_and_plain() -> None:
     program = ASPProgram()
     P = Predicate.define("p_symc", ["x"])
@@ -208,6 +218,21 @@ def test_empty_fact_is_a_no_op() -> None:
     assert "p_empty_fact(1)." in program.render()
 
 
+def test_facts_loads_an_iterable_under_one_location() -> None:
+    # facts() takes the collection itself, validates it whole before adding
+    # anything, and stamps every atom with the one line that called it
+    program = ASPProgram()
+    P = Predicate.define("p_bulk", ["x"])
+    program.facts(P(x=n) for n in range(3))
+    where = _here()
+    rules = list(program["Rules"])
+    assert [rule.render() for rule in rules] == ["p_bulk(0).", "p_bulk(1).", "p_bulk(2)."]
+    assert {rule.source_location for rule in rules} == {SourceLocation(where.filename, where.lineno - 1)}
+    with pytest.raises(ValueError, match=r"facts\(\) requires grounded predicates"):
+        program.facts([P(x=3), P(x=Variable("X"))])
+    assert len(program["Rules"]) == 3
+
+
 def test_empty_conditional_literal_condition_rejected() -> None:
     # A conditionless CL renders as a plain (binding) literal — a category
     # error caught at construction; None must not slip past the empty-list check
@@ -373,6 +398,15 @@ def test_blank_line_renders_as_empty_string() -> None:
     assert BlankLine().render() == ""
 
 
+def test_program_elements_carry_no_instance_dict() -> None:
+    # One element per statement: at millions of facts, a per-instance
+    # __dict__ would dominate the program's footprint
+    P = Predicate.define("p_slot", ["x"])
+    for element in (Rule(head=P(x=1)), Comment("note"), BlankLine(), RawASP("a.")):
+        assert not hasattr(element, "__dict__")
+        assert element.source_location is None
+
+
 def test_rule_rejects_empty_head_and_body() -> None:
     with pytest.raises(ValueError, match="empty head and body"):
         Rule()
@@ -9,7 +9,17 @@ import re
 
 import pytest
 
-from aspalchemy import ASPProgram, Choice, Predicate, RangePool, Segment, SourceLocation, Variable, When
+from aspalchemy import (
+    ASPProgram,
+    Choice,
+    DefinedConstant,
+    Predicate,
+    RangePool,
+    Segment,
+    SourceLocation,
+    Variable,
+    When,
+)
 from aspalchemy.program_elements import BlankLine, Comment, Rule
 
 P = Predicate.define("p_seg", ["x"])
@@ -260,6 +270,24 @@ def test_default_segment_name_is_verbatim() -> None:
         program["myrules"]
 
 
+def test_default_segment_writes_follow_replacement_deletion_and_renaming() -> None:
+    # The verbs resolve the default segment once and reuse it; every way of
+    # changing what the name refers to must reach the next write
+    program = ASPProgram()
+    P = Predicate.define("p_dflt", ["x"])
+    program.fact(P(x=1))
+    replacement = Segment("Rules")
+    program["Rules"] = replacement
+    program.fact(P(x=2))
+    assert [element.render() for element in replacement] == ["p_dflt(2)."]
+    del program["Rules"]
+    program.fact(P(x=3))
+    assert [element.render() for element in program["Rules"]] == ["p_dflt(3)."]
+    program.default_segment = "Other"
+    program.fact(P(x=4))
+    assert [element.render() for element in program["Other"]] == ["p_dflt(4)."]
+
+
 def test_multiline_segment_name_rejected() -> None:
     program = ASPProgram()
     with pytest.raises(ValueError, match="single-line"):
@@ -295,6 +323,15 @@ def test_flat_forbid_rejects_non_term_condition() -> None:
         program.forbid("p(X)")  # type: ignore[arg-type]
 
 
+def test_segment_collects_occurrences_and_constants_of_its_statements() -> None:
+    seg = Segment("s")
+    seg.fact(P(x=DefinedConstant("n")))
+    seg.forbid(-P(x=2))
+    assert seg.collect_predicate_occurrences() == {(P, False, True), (P, True, True)}
+    assert seg.collect_defined_constants() == {"n"}
+    assert Segment("empty").collect_defined_constants() == set()
+
+
 def test_blank_line_and_section_append_elements() -> None:
     seg = Segment("s")
     seg.blank_line()
@@ -118,6 +118,18 @@ def test_convert_predicate_nested_predicate_recurses() -> None:
     assert nested.arguments[0] == clingo.Number(1)
 
 
+def test_convert_symbol_nested_arguments_keep_their_order() -> None:
+    # Nested predicates convert depth-first on an explicit stack: siblings
+    # on either side of a nested term must land in their own fields
+    Leaf = Predicate.define("leaf_ns", ["x"])
+    Pair = Predicate.define("pair_ns", ["left", "right"])
+    Edge = Predicate.define("edge_ns", ["a", "pair", "b"])
+    types = {("leaf_ns", 1): Leaf, ("pair_ns", 2): Pair, ("edge_ns", 3): Edge}
+    symbol = convert_predicate_to_symbol(Edge(a=1, pair=Pair(left=Leaf(x=2), right=-Leaf(x=3)), b="z"))
+    atom = convert_symbol_to_predicate(symbol, types)
+    assert atom == Edge(a=1, pair=Pair(left=Leaf(x=2), right=-Leaf(x=3)), b="z")
+
+
 def test_convert_symbol_unknown_predicate_type_raises() -> None:
     # A model symbol whose (name, arity) is not a declared predicate type is
     # rejected — e.g. an atom from a raw_asp() block with no declared class.
@@ -202,6 +214,19 @@ def test_model_iterates_and_answers_membership() -> None:
     assert -P(x=1) not in model  # the negated atom is a DIFFERENT atom
 
 
+def test_models_of_one_search_share_their_common_atoms() -> None:
+    # Each distinct shown symbol is read back once per search: the fact
+    # every answer set carries is one instance across all of them
+    program = ASPProgram()
+    P = Predicate.define("p_shared", ["x"])
+    program.fact(P(x=0))
+    program.choose(Choice(P(x=1)))
+    models = list(program.solve())
+    assert len(models) == 2
+    first, second = (next(atom for atom in model.atoms(P) if atom == P(x=0)) for model in models)
+    assert first is second
+
+
 def test_model_membership_rejects_what_could_never_be_present() -> None:
     program = ASPProgram()
     P = Predicate.define("p_member_guard", ["x"])
@@ -7,6 +7,7 @@ variable indexing, and comparison-operand guards.
 import copy
 import gc
 import pickle
+import sys
 import threading
 import weakref
 
@@ -486,3 +487,27 @@ def test_values_reintern_through_pickle() -> None:
     for original in (Variable("PklVar"), Number(741), String("pkl"), DefinedConstant("pklconst"), SUP, INF):
         assert pickle.loads(pickle.dumps(original)) is original
     assert pickle.loads(pickle.dumps(Number(9414))) in {Number(9414)}
+
+
+def test_names_are_interned_strings() -> None:
+    # Built at runtime, so not interned by the compiler: construction interns it
+    assert Variable("".join(["Runtime", "Var"])).name is sys.intern("RuntimeVar")
+    assert DefinedConstant("".join(["runtime", "const"])).value is sys.intern("runtimeconst")
+
+
+def test_names_are_validated_as_stored() -> None:
+    # A str subclass whose str() differs: the checks see the converted string
+    class Relabelled(str):
+        def __str__(self) -> str:
+            return "not a name"
+
+    with pytest.raises(ValueError):
+        Variable(Relabelled("Fine"))
+    with pytest.raises(ValueError):
+        DefinedConstant(Relabelled("fine"))
+
+
+def test_values_carry_no_instance_dict() -> None:
+    for value in (Variable("SlotVar"), Number(5), String("slot"), DefinedConstant("slotconst"), SUP, INF):
+        assert not hasattr(value, "__dict__")
+        assert weakref.ref(value)() is value